@@ -5,15 +5,40 @@ import time
 import os
 import re
 import socket
+import threading
 from urllib.parse import urlparse, urlunparse
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, TextIO, Tuple
 import aiohttp
 import psutil
 
 from models import AppDefinition, AppState, AppStatus
-from utils import get_shell_command, resolve_workspace_path, normalize_path, detect_os, convert_wsl_network_path_to_linux
+from utils import LAUNCHER_DIR, get_shell_command, resolve_workspace_path, normalize_path, detect_os, convert_wsl_network_path_to_linux
+
+
+# The host OS cannot change at runtime; resolve it once at import.
+_IS_WINDOWS = detect_os() == 'windows'
+
+# \\wsl.localhost\<distro>\... and \\wsl$\<distro>\... workspace prefixes
+_WSL_LOCALHOST_RE = re.compile(r'^\\\\wsl\.localhost\\([^\\]+)\\', re.IGNORECASE)
+_WSL_DOLLAR_RE = re.compile(r'^\\\\wsl\$\\([^\\]+)\\', re.IGNORECASE)
+
+
+async def _first_true(coros) -> bool:
+    """Run coroutines concurrently and return True as soon as one returns True.
+
+    Remaining coroutines are cancelled once a winner is found.
+    """
+    pending = {asyncio.ensure_future(c) for c in coros}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(not t.cancelled() and t.result() for t in done):
+                return True
+        return False
+    finally:
+        for t in pending:
+            t.cancel()
 
 
 class AppManager:
@@ -27,97 +52,243 @@ class AppManager:
         """
         self.log_dir = Path(log_dir)
         if not self.log_dir.is_absolute():
-            launcher_dir = Path(__file__).parent
-            self.log_dir = launcher_dir / self.log_dir
+            self.log_dir = LAUNCHER_DIR / self.log_dir
         
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Runtime state storage
         self.app_states: Dict[str, AppState] = {}
         
-        # Process tracking
-        self.processes: Dict[str, List[subprocess.Popen]] = {}
+        # Process tracking, with the psutil handle captured at spawn time
+        # {app_id: [(popen, psutil_process_or_None)]}
+        self.processes: Dict[str, List[tuple[subprocess.Popen, Optional[psutil.Process]]]] = {}
 
         # Cache for WSL distro IPs to avoid frequent wsl.exe calls
         # {distro: (ip, ts_epoch)}
         self._wsl_ip_cache: Dict[str, tuple[str, float]] = {}
+        self._wsl_distros: set[str] = set()
+        self._wsl_ip_pending: Dict[str, asyncio.Task] = {}
+        self._wsl_refresh_task: Optional[asyncio.Task] = None
+
+        # Cache for Windows TCP listeners, refreshed as a whole snapshot
+        # {port: (process_name, ts_epoch)}
+        self._listener_cache: Dict[int, tuple[Optional[str], float]] = {}
+
+        # Configured open URLs per app, keyed on the definition's `open` list
+        # {app_id: (open_list, urls)}
+        self._app_open_urls: Dict[str, tuple[list, tuple[str, ...]]] = {}
+
+        # Cache for resolved open URLs
+        # {app_id: ((app_id, urls, workspace), resolved_urls, ts_epoch)}
+        self._resolved_urls_cache: Dict[str, tuple[tuple, List[str], float]] = {}
+
+        # Open log file handles, kept for the app's lifetime
+        self._log_handles: Dict[str, TextIO] = {}
+        self._log_lock = threading.Lock()
+
+        # Log lines are queued and written by a background task; the queue is
+        # created on first use so it binds to the running loop
+        # [(app_id, line_or_None_to_close)]
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_writer_task: Optional[asyncio.Task] = None
+
+        # Shared HTTP session for health checks (created lazily on the running loop)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=30)
+            )
+        return self._http_session
+
+    async def aclose(self):
+        """Release resources held by the manager (call on shutdown)."""
+        # Cancel WSL lookups and wait for them so their wsl.exe children are reaped.
+        wsl_tasks = list(self._wsl_ip_pending.values())
+        if self._wsl_refresh_task is not None:
+            wsl_tasks.append(self._wsl_refresh_task)
+            self._wsl_refresh_task = None
+        self._wsl_ip_pending.clear()
+        for task in wsl_tasks:
+            task.cancel()
+        await asyncio.gather(*wsl_tasks, return_exceptions=True)
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        if self._log_writer_task is not None:
+            # Let queued lines reach disk before closing handles.
+            await self._drain_log()
+            self._log_writer_task.cancel()
+            self._log_writer_task = None
+        for app_id in list(self._log_handles):
+            self._close_log_handle(app_id)
 
     def _get_wsl_distro_from_workspace(self, workspace: str) -> Optional[str]:
         r"""Extract WSL distro name from a Windows UNC path like \\wsl.localhost\Ubuntu\..."""
-        if not workspace:
+        if not workspace or not workspace.startswith('\\\\'):
             return None
-        m = re.match(r'^\\\\wsl\.localhost\\([^\\]+)\\', workspace, flags=re.IGNORECASE)
+        m = _WSL_LOCALHOST_RE.match(workspace)
         if m:
             return m.group(1)
-        m = re.match(r'^\\\\wsl\$\\([^\\]+)\\', workspace, flags=re.IGNORECASE)
+        m = _WSL_DOLLAR_RE.match(workspace)
         if m:
             return m.group(1)
         return None
 
-    def _get_wsl_ip(self, distro: str, *, cache_ttl_sec: float = 30.0) -> Optional[str]:
-        """Return WSL distro IP address by calling `wsl.exe -d <distro> hostname -I`.
+    def _get_wsl_ip(self, distro: str, *, cache_ttl_sec: float = 300.0) -> Optional[str]:
+        """Return the cached WSL distro IP address.
 
-        Uses a short TTL cache because refresh runs frequently.
+        Never blocks: on a cache miss this returns None and schedules a
+        background `wsl.exe -d <distro> hostname -I` lookup. A periodic
+        refresher keeps known distros warm afterwards.
         """
         if not distro:
             return None
-        now = time.time()
+        self._wsl_distros.add(distro)
+        self._ensure_wsl_refresher()
+
         cached = self._wsl_ip_cache.get(distro)
-        if cached and (now - cached[1]) < cache_ttl_sec:
+        if cached and (time.time() - cached[1]) < cache_ttl_sec:
             return cached[0]
 
         try:
-            cp = subprocess.run(
-                ["wsl.exe", "-d", distro, "hostname", "-I"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            out = (cp.stdout or "").strip()
-            # `hostname -I` may return multiple addresses separated by spaces
-            ip = out.split()[0] if out else None
-            if ip:
-                self._wsl_ip_cache[distro] = (ip, now)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        pending = self._wsl_ip_pending.get(distro)
+        if pending is None or pending.done():
+            self._wsl_ip_pending[distro] = loop.create_task(self._fetch_wsl_ip(distro))
+        return None
+
+    async def _ensure_wsl_ip(self, distro: str) -> Optional[str]:
+        """Return the WSL distro IP, awaiting a lookup on cache miss."""
+        ip = self._get_wsl_ip(distro)
+        if ip:
             return ip
+        pending = self._wsl_ip_pending.get(distro)
+        if pending is None:
+            return None
+        try:
+            return await asyncio.shield(pending)
         except Exception:
             return None
 
-    def _tcp_reachable(self, host: str, port: int, *, timeout_sec: float = 0.25) -> bool:
+    async def _fetch_wsl_ip(self, distro: str) -> Optional[str]:
+        """Look up the WSL distro IP via wsl.exe without blocking the event loop."""
+        cmd = ["wsl.exe", "-d", distro, "hostname", "-I"]
+        try:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            except NotImplementedError:
+                # Selector event loops on Windows cannot spawn subprocesses.
+                cp = await asyncio.to_thread(
+                    subprocess.run, cmd, capture_output=True, timeout=2, check=False
+                )
+                stdout = cp.stdout
+            else:
+                try:
+                    stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=2)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    # Reap the child so no process or transport is left behind.
+                    try:
+                        proc.kill()
+                    except ProcessLookupError:
+                        pass
+                    await proc.wait()
+                    raise
+            out = (stdout or b"").decode(errors="replace").strip()
+        except Exception:
+            return None
+
+        # `hostname -I` may return multiple addresses separated by spaces
+        ip = out.split()[0] if out else None
+        if ip:
+            cached = self._wsl_ip_cache.get(distro)
+            if cached and cached[0] != ip:
+                # Resolved URLs may point at the old distro IP.
+                self._resolved_urls_cache.clear()
+            self._wsl_ip_cache[distro] = (ip, time.time())
+        return ip
+
+    def _ensure_wsl_refresher(self):
+        """Start the background WSL IP refresher if a loop is running."""
+        if self._wsl_refresh_task is not None and not self._wsl_refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wsl_refresh_task = loop.create_task(self._refresh_wsl_ips())
+
+    async def _refresh_wsl_ips(self, interval_sec: float = 60.0):
+        """Periodically refresh IPs of all WSL distros seen so far."""
+        while True:
+            await asyncio.sleep(interval_sec)
+            for distro in list(self._wsl_distros):
+                await self._fetch_wsl_ip(distro)
+
+    async def _tcp_reachable(self, host: str, port: int, *, timeout_sec: float = 0.25) -> bool:
+        """Return True if host:port accepts TCP connections, without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
         # Try twice to avoid false negatives on busy machines.
         for _ in range(2):
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
             try:
-                with socket.create_connection((host, int(port)), timeout=timeout_sec):
-                    return True
+                await asyncio.wait_for(loop.sock_connect(sock, (host, int(port))), timeout_sec)
+                return True
             except Exception:
                 continue
+            finally:
+                sock.close()
         return False
 
-    def _windows_listener_process(self, port: int) -> Optional[str]:
+    def _windows_listener_process(self, port: int, *, cache_ttl_sec: float = 2.0) -> Optional[str]:
         """Return the process name listening on the given TCP port on Windows.
 
         If multiple listeners exist, returns the first match. If not on Windows or
         not determinable, returns None.
+
+        Listeners are enumerated once per snapshot and cached for all ports, so
+        resolving several URLs in a row costs a single enumeration.
         """
+        if not _IS_WINDOWS:
+            return None
+        port = int(port)
+        now = time.time()
+        cached = self._listener_cache.get(port)
+        if cached and (now - cached[1]) < cache_ttl_sec:
+            return cached[0]
+
         try:
-            if detect_os() != 'windows':
-                return None
-            for c in psutil.net_connections(kind='tcp'):
-                if not c.laddr:
-                    continue
-                if int(getattr(c.laddr, 'port', -1)) != int(port):
-                    continue
-                if c.status != psutil.CONN_LISTEN:
+            snapshot: Dict[int, Optional[str]] = {}
+            names: Dict[int, Optional[str]] = {}
+            for c in psutil.net_connections(kind='inet'):
+                if c.status != psutil.CONN_LISTEN or not c.laddr or not c.pid:
                     continue
-                if not c.pid:
+                lport = int(getattr(c.laddr, 'port', -1))
+                if lport in snapshot:
                     continue
-                try:
-                    return psutil.Process(c.pid).name()
-                except Exception:
-                    return None
+                if c.pid not in names:
+                    try:
+                        names[c.pid] = psutil.Process(c.pid).name()
+                    except Exception:
+                        names[c.pid] = None
+                snapshot[lport] = names[c.pid]
         except Exception:
             return None
-        return None
+
+        self._listener_cache = {p: (name, now) for p, name in snapshot.items()}
+        self._listener_cache[port] = (snapshot.get(port), now)
+        return snapshot.get(port)
 
     def _is_probably_wsl_proxy(self, proc_name: Optional[str]) -> bool:
         if not proc_name:
@@ -132,22 +303,57 @@ class AppManager:
             'system',
         } or n.startswith('wsl')
 
-    def resolve_open_urls(self, app: AppDefinition) -> List[str]:
+    def _open_urls(self, app: AppDefinition) -> tuple[str, ...]:
+        """Return the app's configured open URLs, reusing the tuple built for it."""
+        cached = self._app_open_urls.get(app.id)
+        if cached is not None and cached[0] is app.open:
+            return cached[1]
+        urls = tuple(u.url for u in app.open)
+        self._app_open_urls[app.id] = (app.open, urls)
+        return urls
+
+    async def resolve_open_urls(self, app: AppDefinition, *, cache_ttl_sec: float = 10.0) -> List[str]:
         """Return URLs to open for the app.
 
         On Windows, when an app runs inside WSL, `http://localhost:<port>` can be
         shadowed by a Windows process already bound to the same port.
         If the workspace indicates a WSL distro UNC path, we try to rewrite
         loopback-host URLs to the WSL distro IP when that IP:port is reachable.
+
+        Results are cached per app for a short TTL because resolving may probe
+        the network and spawn wsl.exe. A result is only cached once every
+        rewrite candidate was reachable, so a URL resolved while the app is
+        still starting isn't pinned.
+        """
+        key = (app.id, self._open_urls(app), app.workspace)
+        now = time.time()
+        cached = self._resolved_urls_cache.get(app.id)
+        if cached and cached[0] == key and (now - cached[2]) < cache_ttl_sec:
+            return list(cached[1])
+
+        resolved, final = await self._resolve_open_urls(app)
+        if final:
+            self._resolved_urls_cache[app.id] = (key, resolved, now)
+        return list(resolved)
+
+    async def _resolve_open_urls(self, app: AppDefinition) -> Tuple[List[str], bool]:
+        """Resolve open URLs for the app without consulting the cache.
+
+        Returns:
+            Resolved URLs, and whether they are safe to cache (False while the
+            distro IP is unknown or a WSL IP:port probe failed)
         """
-        urls = [u.url for u in app.open]
+        urls = list(self._open_urls(app))
         distro = self._get_wsl_distro_from_workspace(app.workspace)
         if not distro:
-            return urls
+            return urls, True
 
         ip = self._get_wsl_ip(distro)
         if not ip:
-            return urls
+            # Don't pin unrewritten URLs while the distro IP is still unknown.
+            return urls, False
+
+        final = True
 
         resolved: List[str] = []
         for url in urls:
@@ -162,7 +368,7 @@ class AppManager:
 
                 if hostname.lower() in ("127.0.0.1", "localhost") and port:
                     # Prefer WSL IP if reachable from Windows.
-                    if self._tcp_reachable(ip, port, timeout_sec=1.0):
+                    if await self._tcp_reachable(ip, port, timeout_sec=1.0):
                         # Preserve scheme, port, path, query, fragment
                         netloc = f"{ip}:{port}"
                         if parsed.username or parsed.password:
@@ -173,6 +379,8 @@ class AppManager:
                             netloc = f"{userinfo}@{netloc}"
                         resolved.append(urlunparse(parsed._replace(netloc=netloc)))
                     else:
+                        # The app may still be starting; retry on the next call.
+                        final = False
                         # If loopback port is owned by a non-WSL Windows process,
                         # opening it is very likely to show the wrong app.
                         listener = self._windows_listener_process(int(port))
@@ -188,7 +396,7 @@ class AppManager:
             except Exception:
                 resolved.append(url)
 
-        return resolved
+        return resolved, final
     
     def get_state(self, app_id: str) -> Optional[AppState]:
         """Get current state of an application.
@@ -224,17 +432,38 @@ class AppManager:
             workspace=app.workspace,
             status=AppStatus.STOPPED,
             ports=app.ports,
-            open_urls=[u.url for u in app.open]
+            open_urls=list(self._open_urls(app))
         )
         self.app_states[app.id] = state
         return state
     
-    async def check_health(self, app: AppDefinition, timeout: int = 5, *, emit_errors: bool = True) -> bool:
+    def _listening_ports(self) -> Optional[set[int]]:
+        """Return the set of locally listening TCP ports, or None if unavailable."""
+        try:
+            return {
+                c.laddr.port
+                for c in psutil.net_connections(kind='inet')
+                if c.status == psutil.CONN_LISTEN and c.laddr
+            }
+        except Exception:
+            # e.g. AccessDenied on platforms that restrict socket enumeration
+            return None
+
+    async def check_health(
+        self,
+        app: AppDefinition,
+        timeout: int = 5,
+        *,
+        emit_errors: bool = True,
+        port_snapshot: Optional[set[int]] = None,
+    ) -> bool:
         """Check if application is healthy.
         
         Args:
             app: Application definition
             timeout: Request timeout in seconds
+            port_snapshot: Listening ports from `_listening_ports()`; when given,
+                local port checks use it instead of connecting
             
         Returns:
             True if healthy, False otherwise
@@ -260,8 +489,11 @@ class AppManager:
                 except Exception:
                     return False
 
-            # Succeed if either loopback family works.
-            if await try_host("127.0.0.1") or await try_host("::1"):
+            if port_snapshot is not None:
+                if port in port_snapshot:
+                    return True
+            # Race both loopback families; succeed if either connects.
+            elif await _first_true([try_host("127.0.0.1"), try_host("::1")]):
                 return True
 
             # For apps running in WSL, localhost forwarding can be unavailable or delayed.
@@ -310,52 +542,46 @@ class AppManager:
         # If no health checks are configured, fall back to process liveness.
         # This supports CLI-style apps that don't expose an HTTP endpoint.
         if not has_http_checks and not has_port_checks:
-            procs = self.processes.get(app.id, [])
-            return any(p.poll() is None for p in procs)
+            return self._reap_processes(app.id)
+
+        session = await self._get_session() if has_http_checks else None
 
-        # Try each health check URL (HTTP)
-        http_ok = False
-        for health in app.health:
+        async def probe_http(url: str) -> bool:
+            """Return True if the URL answers with a non-5xx status."""
             try:
-                async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    return response.status < 500  # 2xx, 3xx, 4xx are considered "up"
+            except Exception as e:
+                # Retry localhost checks against WSL distro IP when applicable.
+                fallback_url = _rewrite_health_url_for_wsl(url)
+                if fallback_url == url:
+                    if emit_errors:
+                        print(f"Health check failed for {app.id} at {url}: {e}")
+                    return False
+                try:
                     async with session.get(
-                        health.url,
+                        fallback_url,
                         timeout=aiohttp.ClientTimeout(total=timeout)
                     ) as response:
-                        if response.status < 500:  # 2xx, 3xx, 4xx are considered "up"
-                            http_ok = True
-                            break
-            except Exception as e:
-                # Retry localhost checks against WSL distro IP when applicable.
-                fallback_url = _rewrite_health_url_for_wsl(health.url)
-                if fallback_url != health.url:
-                    try:
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(
-                                fallback_url,
-                                timeout=aiohttp.ClientTimeout(total=timeout)
-                            ) as response:
-                                if response.status < 500:
-                                    http_ok = True
-                                    break
-                    except Exception as fallback_e:
-                        # Log error but continue to next health check
-                        if emit_errors:
-                            print(f"Health check failed for {app.id} at {health.url} and fallback {fallback_url}: {fallback_e}")
-                        continue
-                else:
-                    # Log error but continue to next health check
+                        return response.status < 500
+                except Exception as fallback_e:
                     if emit_errors:
-                        print(f"Health check failed for {app.id} at {health.url}: {e}")
-                    continue
+                        print(f"Health check failed for {app.id} at {url} and fallback {fallback_url}: {fallback_e}")
+                    return False
+
+        async def all_ports_ok() -> bool:
+            """Require every declared port to be reachable."""
+            results = await asyncio.gather(*(port_reachable(int(port)) for port in app.ports))
+            return all(results)
 
-        # If ports are declared, require them to be reachable too.
-        ports_ok = True
-        if getattr(app, "ports", None):
-            for port in app.ports:
-                if not await port_reachable(int(port)):
-                    ports_ok = False
-                    break
+        # Run HTTP and port checks concurrently.
+        http_ok, ports_ok = await asyncio.gather(
+            _first_true([probe_http(h.url) for h in app.health]) if has_http_checks else asyncio.sleep(0, False),
+            all_ports_ok() if has_port_checks else asyncio.sleep(0, True),
+        )
 
         # If only one kind of check was configured, don't require the other.
         if has_http_checks and has_port_checks:
@@ -375,13 +601,16 @@ class AppManager:
             True if became healthy, False if timeout
         """
         start_time = time.time()
-        retry_interval = 2  # seconds
+        # Poll quickly at first (most apps come up within seconds), then back off.
+        retry_interval = 0.1  # seconds
+        max_retry_interval = 2.0
         
         while time.time() - start_time < max_timeout:
             if await self.check_health(app, timeout=5, emit_errors=emit_errors):
                 return True
             
             await asyncio.sleep(retry_interval)
+            retry_interval = min(retry_interval * 1.5, max_retry_interval)
         
         return False
     
@@ -412,12 +641,51 @@ class AppManager:
             return f"No log file found at {log_path}"
         
         try:
-            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                all_lines = f.readlines()
-                return ''.join(all_lines[-lines:])
+            if lines <= 0:
+                with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                    return f.read()
+            return self._read_tail(log_path, lines)
         except Exception as e:
             return f"Error reading log: {e}"
     
+    @staticmethod
+    def _read_tail(log_path: Path, lines: int, block_size: int = 64 * 1024) -> str:
+        """Return the last `lines` lines of a file, reading backwards in blocks.
+
+        Args:
+            log_path: File to read
+            lines: Number of lines to return
+            block_size: Bytes read per backward step
+
+        Returns:
+            Tail content with newlines normalized to '\\n'
+        """
+        with open(log_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            chunks: List[bytes] = []
+            newlines = 0
+            # One extra newline guarantees the oldest returned line is complete.
+            while pos > 0 and newlines <= lines:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b'\n')
+
+        text = b''.join(reversed(chunks)).decode('utf-8', errors='replace')
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        tail = text.split('\n')
+        if pos > 0:
+            # The first entry is a partial line when we stopped mid-file.
+            tail = tail[1:]
+        ends_with_newline = tail and tail[-1] == ''
+        if ends_with_newline:
+            tail.pop()
+        tail = tail[-lines:]
+        return '\n'.join(tail) + ('\n' if ends_with_newline and tail else '')
+    
     def _write_log(self, app_id: str, message: str):
         """Write message to application log.
         
@@ -425,14 +693,86 @@ class AppManager:
             app_id: Application ID
             message: Message to write
         """
-        log_path = self.get_log_path(app_id)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._enqueue_log(app_id, f"[{timestamp}] {message}\n")
+
+    def _enqueue_log(self, app_id: str, line: Optional[str]):
+        """Queue a log line for the background writer.
+
+        Args:
+            app_id: Application ID
+            line: Formatted line, or None to close the app's log handle
+        """
         try:
-            with open(log_path, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] {message}\n")
-        except Exception as e:
-            print(f"Error writing to log {log_path}: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. called from a script); write inline.
+            self._flush_log_batch([(app_id, line)])
+            return
+        if self._log_queue is None:
+            self._log_queue = asyncio.Queue()
+        self._log_queue.put_nowait((app_id, line))
+        if self._log_writer_task is None or self._log_writer_task.done():
+            self._log_writer_task = loop.create_task(self._log_writer())
+
+    async def _drain_log(self):
+        """Wait until every queued log line has been written."""
+        if self._log_queue is not None:
+            await self._log_queue.join()
+
+    async def _log_writer(self):
+        """Drain queued log lines in batches, writing them off the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_queue.get()]
+            while not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            try:
+                await loop.run_in_executor(None, self._flush_log_batch, batch)
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
+    def _flush_log_batch(self, batch: List[tuple[str, Optional[str]]]):
+        """Write a batch of queued log lines (runs in a worker thread).
+
+        Args:
+            batch: (app_id, line) pairs; a None line closes that app's handle
+        """
+        for app_id, line in batch:
+            if line is None:
+                self._close_log_handle(app_id)
+                continue
+            try:
+                self._get_log_handle(app_id).write(line)
+            except Exception as e:
+                print(f"Error writing to log {self.get_log_path(app_id)}: {e}")
+
+    def _get_log_handle(self, app_id: str) -> TextIO:
+        """Return the cached append handle for an application log, opening it once.
+
+        Args:
+            app_id: Application ID
+
+        Returns:
+            Line-buffered text handle
+        """
+        with self._log_lock:
+            handle = self._log_handles.get(app_id)
+            if handle is None or handle.closed:
+                handle = open(self.get_log_path(app_id), 'a', encoding='utf-8', buffering=1)
+                self._log_handles[app_id] = handle
+            return handle
+
+    def _close_log_handle(self, app_id: str):
+        """Close the cached log handle for an application, if any."""
+        with self._log_lock:
+            handle = self._log_handles.pop(app_id, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:
+                pass
     
     async def start_app(self, app: AppDefinition) -> bool:
         """Start an application.
@@ -450,7 +790,9 @@ class AppManager:
         # Update state to STARTING
         state.status = AppStatus.STARTING
         state.message = "Starting application..."
-        state.last_check = datetime.now().isoformat()
+        state.last_check_ts = time.time()
+        # URLs resolved before this start may predate the app's listeners.
+        self._resolved_urls_cache.pop(app.id, None)
         
         self._write_log(app.id, f"=== Starting {app.name} ===")
         
@@ -465,6 +807,12 @@ class AppManager:
         
         # Execute start commands
         self.processes[app.id] = []
+
+        # WSL bash on Windows needs the Linux form of the workspace; it is the
+        # same for every command, so convert it once.
+        converted_workspace = (
+            convert_wsl_network_path_to_linux(workspace_path) if _IS_WINDOWS else workspace_path
+        )
         
         for cmd in app.start:
             try:
@@ -475,14 +823,17 @@ class AppManager:
                 
                 # If using bash shell and cwd is a WSL network path, convert it
                 cwd_for_command = cwd
-                if cmd.shell == 'bash' and detect_os() == 'windows':
-                    cwd_for_command = convert_wsl_network_path_to_linux(cwd)
+                if cmd.shell == 'bash' and _IS_WINDOWS:
+                    if cwd == workspace_path:
+                        cwd_for_command = converted_workspace
+                    else:
+                        cwd_for_command = convert_wsl_network_path_to_linux(cwd)
 
                 # Replace {workspace} placeholder inside the command string too.
                 command_str = cmd.cmd
                 workspace_for_command = workspace_path
-                if cmd.shell == 'bash' and detect_os() == 'windows':
-                    workspace_for_command = convert_wsl_network_path_to_linux(workspace_path)
+                if cmd.shell == 'bash' and _IS_WINDOWS:
+                    workspace_for_command = converted_workspace
                 command_str = command_str.replace("{workspace}", workspace_for_command)
                 
                 # Get shell command
@@ -494,12 +845,14 @@ class AppManager:
                 self._write_log(app.id, f"Executing: {' '.join(full_cmd)}")
                 self._write_log(app.id, f"Working directory: {cwd} (command uses: {cwd_for_command})")
                 
-                # Open log file for output
-                log_file = open(self.get_log_path(app.id), 'a', encoding='utf-8')
+                # Share the app's log handle for process output; queued lines
+                # must land first so the header precedes the child's output.
+                await self._drain_log()
+                log_file = self._get_log_handle(app.id)
                 
                 # Start process
                 # For bash on Windows, cwd is handled in the command itself, so pass None
-                process_cwd = None if (cmd.shell == 'bash' and detect_os() == 'windows') else cwd
+                process_cwd = None if (cmd.shell == 'bash' and _IS_WINDOWS) else cwd
                 process = subprocess.Popen(
                     full_cmd,
                     cwd=process_cwd,
@@ -509,7 +862,11 @@ class AppManager:
                     shell=False
                 )
                 
-                self.processes[app.id].append(process)
+                try:
+                    handle = psutil.Process(process.pid)
+                except psutil.Error:
+                    handle = None
+                self.processes[app.id].append((process, handle))
                 self._write_log(app.id, f"Process started with PID: {process.pid}")
 
                 # Fail fast if the process immediately exits (common for misconfigured scripts).
@@ -557,7 +914,7 @@ class AppManager:
             state.message = f"Health check timeout after {max_timeout}s"
             self._write_log(app.id, f"ERROR: Health check timeout after {max_timeout}s")
         
-        state.last_check = datetime.now().isoformat()
+        state.last_check_ts = time.time()
     
     async def launch_app(self, app: AppDefinition) -> Dict:
         """Launch application (check health, start if needed, open URLs).
@@ -571,18 +928,23 @@ class AppManager:
         state = self.app_states.get(app.id)
         if not state:
             state = self.init_state(app)
+
+        # Warm the WSL IP cache so health fallbacks and URL rewriting can use it.
+        distro = self._get_wsl_distro_from_workspace(app.workspace)
+        if distro:
+            await self._ensure_wsl_ip(distro)
         
         # Quick health check first
         if await self.check_health(app, timeout=3, emit_errors=False):
             # Already running
             state.status = AppStatus.RUNNING
             state.message = "Application is already running"
-            state.last_check = datetime.now().isoformat()
+            state.last_check_ts = time.time()
             
             return {
                 "status": "success",
                 "message": "Application is already running",
-                "open_urls": self.resolve_open_urls(app)
+                "open_urls": await self.resolve_open_urls(app)
             }
         
         # Not running, start it
@@ -602,17 +964,17 @@ class AppManager:
         if healthy:
             state.status = AppStatus.RUNNING
             state.message = "Application started successfully"
-            state.last_check = datetime.now().isoformat()
+            state.last_check_ts = time.time()
             
             return {
                 "status": "success",
                 "message": "Application started successfully",
-                "open_urls": self.resolve_open_urls(app)
+                "open_urls": await self.resolve_open_urls(app)
             }
         else:
             state.status = AppStatus.ERROR
             state.message = f"Health check timeout after {max_timeout}s"
-            state.last_check = datetime.now().isoformat()
+            state.last_check_ts = time.time()
             
             return {
                 "status": "error",
@@ -620,6 +982,46 @@ class AppManager:
                 "open_urls": []
             }
     
+    @staticmethod
+    def _terminate_all(processes: List[tuple[subprocess.Popen, Optional[psutil.Process]]]):
+        """Terminate processes and their children, killing any that linger.
+
+        All trees are signalled first and then waited on together, so the grace
+        period is bounded by a single timeout regardless of process count.
+
+        Args:
+            processes: (Popen, psutil handle captured at spawn time) pairs
+        """
+        targets: List[psutil.Process] = []
+        for proc, parent in processes:
+            try:
+                if parent is None:
+                    parent = psutil.Process(proc.pid)
+                targets.extend(parent.children(recursive=True))
+                targets.append(parent)
+            except Exception as e:
+                print(f"Error stopping process: {e}")
+
+        for p in targets:
+            try:
+                p.terminate()
+            except psutil.NoSuchProcess:
+                pass
+            except Exception as e:
+                print(f"Error stopping process: {e}")
+
+        # Wait for termination
+        gone, alive = psutil.wait_procs(targets, timeout=5)
+
+        # Force kill if still alive
+        for p in alive:
+            try:
+                p.kill()
+            except psutil.NoSuchProcess:
+                pass
+            except Exception as e:
+                print(f"Error stopping process: {e}")
+
     async def stop_app(self, app_id: str) -> bool:
         """Stop an application.
         
@@ -629,88 +1031,147 @@ class AppManager:
         Returns:
             True if stopped successfully
         """
-        if app_id not in self.processes:
+        self._resolved_urls_cache.pop(app_id, None)
+
+        # Take ownership before awaiting so a concurrent refresh or stop can't
+        # reap or tear down the same processes underneath us.
+        processes = self.processes.pop(app_id, None)
+        if processes is None:
             return True
-        
-        processes = self.processes[app_id]
-        
-        for proc in processes:
-            try:
-                # Terminate process and children
-                parent = psutil.Process(proc.pid)
-                children = parent.children(recursive=True)
-                
-                for child in children:
-                    child.terminate()
-                parent.terminate()
-                
-                # Wait for termination
-                gone, alive = psutil.wait_procs(children + [parent], timeout=5)
-                
-                # Force kill if still alive
-                for p in alive:
-                    p.kill()
-                
-            except Exception as e:
-                print(f"Error stopping process: {e}")
-        
-        del self.processes[app_id]
+
+        # Blocking waits run in a worker thread to keep the event loop free.
+        await asyncio.get_running_loop().run_in_executor(None, self._terminate_all, processes)
         
         # Update state
         if app_id in self.app_states:
             self.app_states[app_id].status = AppStatus.STOPPED
             self.app_states[app_id].message = "Application stopped"
-            self.app_states[app_id].last_check = datetime.now().isoformat()
+            self.app_states[app_id].last_check_ts = time.time()
         
         self._write_log(app_id, "Application stopped")
+        self._enqueue_log(app_id, None)
         
         return True
     
+    def _reap_processes(self, app_id: str) -> bool:
+        """Drop exited processes for an application.
+
+        Each tracked process is polled once; exited ones are removed so later
+        ticks only poll live processes.
+
+        Args:
+            app_id: Application ID
+
+        Returns:
+            True if any process is still alive
+        """
+        procs = self.processes.get(app_id)
+        if not procs:
+            return False
+        alive = [entry for entry in procs if entry[0].poll() is None]
+        if alive:
+            if len(alive) != len(procs):
+                self.processes[app_id] = alive
+            return True
+        # No alive processes left
+        self.processes.pop(app_id, None)
+        return False
+
     async def refresh_states(self, apps: List[AppDefinition]):
         """Refresh states for all applications.
         
         Args:
             apps: List of application definitions
         """
-        for app in apps:
-            if app.id not in self.app_states:
-                self.init_state(app)
-            
-            state = self.app_states[app.id]
-
-            # Reap exited processes so we don't get stuck in STARTING forever.
-            procs = self.processes.get(app.id, [])
-            if procs:
-                alive = [p for p in procs if p.poll() is None]
-                if alive:
-                    self.processes[app.id] = alive
-                else:
-                    # No alive processes left
-                    self.processes.pop(app.id, None)
-            
-            has_http_checks = bool(getattr(app, "health", None))
-            has_port_checks = bool(getattr(app, "ports", None))
+        # One socket enumeration answers every local port check in this pass.
+        # It is a full connection-table scan, so skip it when no app declares
+        # ports and run it off the event loop otherwise.
+        port_snapshot = None
+        if any(app.ports for app in apps):
+            port_snapshot = await asyncio.to_thread(self._listening_ports)
 
-            # Skip if currently starting AND we rely on external health/port checks.
-            # For CLI-style apps (no checks configured), we still want to update
-            # based on process liveness so the UI doesn't get stuck in STARTING.
-            if state.status == AppStatus.STARTING and (has_http_checks or has_port_checks):
-                continue
-            
-            # Check health
-            healthy = await self.check_health(app, timeout=3, emit_errors=False)
-            
-            if healthy:
-                state.status = AppStatus.RUNNING
-                state.message = "Application is running"
+        # Apps are independent, so check them concurrently; one failure must
+        # not abort the others, but it still has to be reported.
+        results = await asyncio.gather(
+            *(self._refresh_one(app, port_snapshot) for app in apps),
+            return_exceptions=True,
+        )
+        for app, result in zip(apps, results):
+            if isinstance(result, Exception):
+                print(f"Error refreshing state for {app.id}: {result!r}")
+
+    async def refresh_and_get(self, apps: List[AppDefinition]) -> List[dict]:
+        """Refresh all application states and build the API listing.
+
+        Args:
+            apps: List of application definitions
+
+        Returns:
+            One response dict per application, in input order
+        """
+        await self.refresh_states(apps)
+        open_urls = await asyncio.gather(*(self.resolve_open_urls(app) for app in apps))
+
+        states = self.app_states
+        init_state = self.init_state
+        result = []
+        append = result.append
+        for app, urls in zip(apps, open_urls):
+            state = states.get(app.id) or init_state(app)
+            append({
+                "id": app.id,
+                "name": app.name,
+                "workspace": app.workspace,
+                "status": state.status.value,
+                "message": state.message,
+                "last_check": state.last_check,
+                "ports": app.ports,
+                "open_urls": urls,
+            })
+        return result
+
+    async def _refresh_one(self, app: AppDefinition, port_snapshot: Optional[set[int]]):
+        """Refresh state for a single application.
+
+        Args:
+            app: Application definition
+            port_snapshot: Listening ports shared across the refresh pass
+        """
+        if app.id not in self.app_states:
+            self.init_state(app)
+        
+        state = self.app_states[app.id]
+
+        # Reap exited processes so we don't get stuck in STARTING forever.
+        has_live_processes = self._reap_processes(app.id)
+        
+        has_http_checks = bool(getattr(app, "health", None))
+        has_port_checks = bool(getattr(app, "ports", None))
+
+        # Skip if currently starting AND we rely on external health/port checks.
+        # For CLI-style apps (no checks configured), we still want to update
+        # based on process liveness so the UI doesn't get stuck in STARTING.
+        if state.status == AppStatus.STARTING and (has_http_checks or has_port_checks):
+            return
+        
+        # Check health. Without configured checks, health is process liveness,
+        # which was just determined above.
+        if has_http_checks or has_port_checks:
+            healthy = await self.check_health(app, timeout=3, emit_errors=False, port_snapshot=port_snapshot)
+        else:
+            healthy = has_live_processes
+        
+        if healthy:
+            state.status = AppStatus.RUNNING
+            state.message = "Application is running"
+        else:
+            # Check if we have active processes
+            if app.id in self.processes and self.processes[app.id]:
+                # Process exists but not healthy yet
+                state.status = AppStatus.STARTING
+                state.message = "Starting..."
             else:
-                # Check if we have active processes
-                if app.id in self.processes and self.processes[app.id]:
-                    # Process exists but not healthy yet
-                    state.status = AppStatus.STARTING
-                    state.message = "Starting..."
-                else:
-                    state.status = AppStatus.STOPPED
-                    state.message = "Application is stopped"
-            
-            state.last_check = datetime.now().isoformat()
+                state.status = AppStatus.STOPPED
+                state.message = "Application is stopped"
+        
+        state.last_check_ts = time.time()
@@ -1,9 +1,19 @@
 """Configuration file management."""
+import asyncio
+import logging
 import os
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from models import AppDefinition, StartCommand, HealthCheck, OpenUrl
+from utils import LAUNCHER_DIR
+
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class ConfigManager:
@@ -18,8 +28,13 @@ class ConfigManager:
         self.config_path = Path(config_path)
         if not self.config_path.is_absolute():
             # Make path relative to launcher directory
-            launcher_dir = Path(__file__).parent
-            self.config_path = launcher_dir / self.config_path
+            self.config_path = LAUNCHER_DIR / self.config_path
+
+        # Parsed apps and their {id: index} map, keyed on the file's (mtime_ns, size, inode)
+        self._cache: Optional[Tuple[Tuple[int, int, int], List[AppDefinition], Dict[str, int]]] = None
+
+        # Raw text of the config file, keyed the same way, to skip no-op saves
+        self._cached_text: Optional[Tuple[Tuple[int, int, int], str]] = None
     
     def load_apps(self) -> List[AppDefinition]:
         """Load application definitions from apps.yaml.
@@ -27,23 +42,91 @@ class ConfigManager:
         Returns:
             List of AppDefinition objects
         """
-        print(f"[DEBUG] Loading apps from: {self.config_path}")
-        print(f"[DEBUG] Config file exists: {self.config_path.exists()}")
+        apps, _ = self._get_apps()
+        # Hand out a copy so callers can't reorder the cache.
+        return list(apps)
+
+    async def aload_apps(self) -> List[AppDefinition]:
+        """Load application definitions without blocking the event loop.
+        
+        Serves unchanged files straight from the cache; otherwise the read and
+        parse run in a worker thread.
+        
+        Returns:
+            List of AppDefinition objects
+        """
+        apps, _ = await self._aget_apps()
+        return list(apps)
+
+    def get_app(self, app_id: str) -> Optional[AppDefinition]:
+        """Look up a single application definition by ID.
+        
+        Args:
+            app_id: Application ID
+            
+        Returns:
+            AppDefinition or None
+        """
+        apps, index = self._get_apps()
+        i = index.get(app_id)
+        return apps[i] if i is not None else None
+
+    async def aget_app(self, app_id: str) -> Optional[AppDefinition]:
+        """Look up a single application definition without blocking the event loop.
+        
+        Args:
+            app_id: Application ID
+            
+        Returns:
+            AppDefinition or None
+        """
+        apps, index = await self._aget_apps()
+        i = index.get(app_id)
+        return apps[i] if i is not None else None
+
+    async def _aget_apps(self) -> Tuple[List[AppDefinition], Dict[str, int]]:
+        """Async `_get_apps`: cache hits are served inline, misses parse in a thread."""
+        cache = self._cache
+        if cache is not None:
+            try:
+                if self._file_key() == cache[0]:
+                    return cache[1], cache[2]
+            except OSError:
+                pass
+        return await asyncio.to_thread(self._get_apps)
+
+    def _file_key(self) -> Tuple[int, int, int]:
+        """Return the (mtime_ns, size, inode) identity of the config file."""
+        st = self.config_path.stat()
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _get_apps(self) -> Tuple[List[AppDefinition], Dict[str, int]]:
+        """Return the cached apps and {id: index} map, re-parsing if the file changed.
+
+        The returned objects are shared with the cache and must not be mutated.
+        """
+        logger.debug("Loading apps from: %s", self.config_path)
         
         if not self.config_path.exists():
             # Return empty list if config doesn't exist yet
-            print(f"[WARNING] Config file not found at {self.config_path}")
-            return []
+            logger.warning("Config file not found at %s", self.config_path)
+            return [], {}
         
         try:
+            key = self._file_key()
+            if self._cache is not None and self._cache[0] == key:
+                return self._cache[1], self._cache[2]
+
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                text = f.read()
+            self._cached_text = (key, text)
+            data = yaml.load(text, Loader=Loader)
             
-            print(f"[DEBUG] Loaded YAML data: {data}")
+            logger.debug("Loaded YAML data: %s", data)
             
             if not data:
-                print("[WARNING] YAML file is empty")
-                return []
+                logger.warning("YAML file is empty")
+                return [], {}
             
             apps = []
             for app_data in data:
@@ -82,16 +165,16 @@ class ConfigManager:
                     ports=app_data.get('ports', [])
                 )
                 apps.append(app)
-                print(f"[DEBUG] Loaded app: {app.id} - {app.name}")
+                logger.debug("Loaded app: %s - %s", app.id, app.name)
             
-            print(f"[DEBUG] Total apps loaded: {len(apps)}")
-            return apps
+            logger.debug("Total apps loaded: %d", len(apps))
+            index = {a.id: i for i, a in enumerate(apps)}
+            self._cache = (key, apps, index)
+            return apps, index
         
         except Exception as e:
-            print(f"[ERROR] Error loading apps.yaml: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            logger.exception("Error loading apps.yaml: %s", e)
+            return [], {}
     
     def save_apps(self, apps: List[AppDefinition]) -> bool:
         """Save application definitions to apps.yaml.
@@ -102,6 +185,8 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        cached_text = self._cached_text
+        self._cache = None
         try:
             # Convert to dict format
             data = []
@@ -133,17 +218,31 @@ class ConfigManager:
                 }
                 data.append(app_dict)
             
-            # Ensure parent directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            new_text = yaml.dump(data, Dumper=Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
             
-            # Write YAML
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            # Skip the write when the file already holds exactly this content.
+            try:
+                key = self._file_key()
+            except OSError:
+                key = None
+            if cached_text is None or cached_text != (key, new_text):
+                # Ensure parent directory exists
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Write to a temp file and swap it in so readers never see a partial file
+                tmp_path = self.config_path.with_suffix(self.config_path.suffix + '.tmp')
+                tmp_path.write_text(new_text, encoding='utf-8')
+                os.replace(tmp_path, self.config_path)
+                key = self._file_key()
+                self._cached_text = (key, new_text)
             
+            # What the file holds is what a re-read would parse, so prime the cache.
+            apps = list(apps)
+            self._cache = (key, apps, {a.id: i for i, a in enumerate(apps)})
             return True
         
         except Exception as e:
-            print(f"Error saving apps.yaml: {e}")
+            logger.error("Error saving apps.yaml: %s", e)
             return False
     
     def add_app(self, app: AppDefinition) -> bool:
@@ -155,14 +254,13 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        apps = self.load_apps()
+        apps, index = self._get_apps()
         
         # Check if app ID already exists
-        if any(a.id == app.id for a in apps):
+        if app.id in index:
             return False
         
-        apps.append(app)
-        return self.save_apps(apps)
+        return self.save_apps(apps + [app])
     
     def update_app(self, app: AppDefinition) -> bool:
         """Update an existing application in configuration.
@@ -173,15 +271,15 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        apps = self.load_apps()
+        apps, index = self._get_apps()
         
-        # Find and replace
-        for i, a in enumerate(apps):
-            if a.id == app.id:
-                apps[i] = app
-                return self.save_apps(apps)
+        i = index.get(app.id)
+        if i is None:
+            return False
         
-        return False
+        apps = list(apps)
+        apps[i] = app
+        return self.save_apps(apps)
     
     def delete_app(self, app_id: str) -> bool:
         """Delete an application from configuration.
@@ -192,6 +290,9 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
-        apps = self.load_apps()
-        apps = [a for a in apps if a.id != app_id]
-        return self.save_apps(apps)
+        apps, index = self._get_apps()
+        i = index.get(app_id)
+        if i is None:
+            # Nothing to delete; don't rewrite the file.
+            return False
+        return self.save_apps(apps[:i] + apps[i + 1:])
@@ -3,7 +3,8 @@ import asyncio
 import os
 import socket
 import sys
-from contextlib import closing
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -11,22 +12,30 @@ from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from typing import List, Optional
 import uvicorn
-from pathlib import Path
 
 from models import AppDefinition, AppState, StartCommand, HealthCheck, OpenUrl
 from config import ConfigManager
 from app_manager import AppManager
+from utils import LAUNCHER_DIR
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared resources held by the app manager on shutdown."""
+    yield
+    await app_manager.aclose()
 
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Nexus Web Launcher",
     description="Launch and manage local web applications",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Setup paths
-BASE_DIR = Path(__file__).parent
+BASE_DIR = LAUNCHER_DIR
 TEMPLATE_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
 
@@ -48,31 +57,58 @@ try:
     VITE_PORT = int((os.environ.get("VITE_PORT", "5173").strip() or "5173"))
 except ValueError:
     VITE_PORT = 5173
+VITE_ORIGIN = f"http://{VITE_HOST}:{VITE_PORT}"
+
 
+# Last Vite probe result, reused for a short TTL so page loads don't each wait on it
+_vite_probe_cache = {"ts": float("-inf"), "val": False}
 
-def _is_vite_reachable(host: str = VITE_HOST, port: int = VITE_PORT, timeout_sec: float = 0.15) -> bool:
+# Production context never changes, so it is built once at import time.
+_PROD_CTX = (
+    {"launcher_env": "production", "use_vite": False, "vite_origin": VITE_ORIGIN}
+    if LAUNCHER_ENV in {"production", "prod"}
+    else None
+)
+# Development contexts only differ by Vite reachability; keyed by that flag.
+_DEV_CTX = {
+    use_vite: {"launcher_env": "development", "use_vite": use_vite, "vite_origin": VITE_ORIGIN}
+    for use_vite in (False, True)
+}
+
+
+async def _is_vite_reachable(
+    host: str = VITE_HOST,
+    port: int = VITE_PORT,
+    timeout_sec: float = 0.15,
+    cache_ttl_sec: float = 2.0,
+) -> bool:
     """Return True when the Vite dev server is reachable."""
+    now = time.monotonic()
+    if now - _vite_probe_cache["ts"] < cache_ttl_sec:
+        return _vite_probe_cache["val"]
     try:
-        with closing(socket.create_connection((host, int(port)), timeout=timeout_sec)):
-            return True
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host=host, port=int(port)),
+            timeout=timeout_sec,
+        )
+        writer.close()
+        reachable = True
     except Exception:
-        return False
+        reachable = False
+    _vite_probe_cache["ts"] = now
+    _vite_probe_cache["val"] = reachable
+    return reachable
 
 
-def _frontend_context() -> dict:
+async def _frontend_context() -> dict:
     """Build template context for frontend asset loading.
 
     Default behavior is development mode. In development mode, Vite is used
     when available; otherwise, static assets are served as a safe fallback.
     """
-    env_mode = "development" if LAUNCHER_ENV not in {"production", "prod"} else "production"
-    use_vite = env_mode == "development" and _is_vite_reachable()
-    vite_origin = f"http://{VITE_HOST}:{VITE_PORT}"
-    return {
-        "launcher_env": env_mode,
-        "use_vite": use_vite,
-        "vite_origin": vite_origin,
-    }
+    if _PROD_CTX is not None:
+        return _PROD_CTX
+    return _DEV_CTX[await _is_vite_reachable()]
 
 
 # API Models
@@ -99,45 +135,28 @@ class UpdateWorkspaceRequest(BaseModel):
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Render main launcher page."""
-    context = {"request": request, **_frontend_context()}
+    frontend = await _frontend_context()
+    context = {
+        "request": request,
+        "launcher_env": frontend["launcher_env"],
+        "use_vite": frontend["use_vite"],
+        "vite_origin": frontend["vite_origin"],
+    }
     return templates.TemplateResponse("index.html", context)
 
 
 @app.get("/api/apps")
 async def get_apps():
     """Get all applications and their states."""
-    apps = config_manager.load_apps()
-    
-    # Refresh states
-    await app_manager.refresh_states(apps)
-    
-    # Build response
-    result = []
-    for app in apps:
-        state = app_manager.get_state(app.id)
-        if not state:
-            state = app_manager.init_state(app)
-        
-        result.append({
-            "id": app.id,
-            "name": app.name,
-            "workspace": app.workspace,
-            "status": state.status.value,
-            "message": state.message,
-            "last_check": state.last_check,
-            "ports": app.ports,
-            "open_urls": app_manager.resolve_open_urls(app)
-        })
-    
-    return {"apps": result}
+    apps = await config_manager.aload_apps()
+    return {"apps": await app_manager.refresh_and_get(apps)}
 
 
 @app.post("/api/apps/launch")
 async def launch_app(request: LaunchRequest):
     """Launch an application."""
     print(f"[DEBUG] Launch request received: app_id={request.app_id}")
-    apps = config_manager.load_apps()
-    app = next((a for a in apps if a.id == request.app_id), None)
+    app = await config_manager.aget_app(request.app_id)
     
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -215,14 +234,13 @@ async def add_app(request: AddAppRequest):
 @app.post("/api/apps/update-workspace")
 async def update_workspace(request: UpdateWorkspaceRequest):
     """Update application workspace."""
-    apps = config_manager.load_apps()
-    app = next((a for a in apps if a.id == request.app_id), None)
+    app = await config_manager.aget_app(request.app_id)
     
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    # Update workspace
-    app.workspace = request.workspace
+    # Update workspace on a copy; the looked-up definition is shared with the config cache
+    app = app.model_copy(update={"workspace": request.workspace})
     
     success = config_manager.update_app(app)
     
@@ -277,32 +295,34 @@ def main():
     else:
         preferred_port = 8080
 
-    def is_port_available(check_host: str, check_port: int) -> bool:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            try:
-                sock.bind((check_host, check_port))
-            except OSError:
-                return False
-            return True
+    def is_port_available(check_host: str, check_port: int, sock: socket.socket) -> bool:
+        # A failed bind leaves the socket unbound, so one socket can be retried
+        # across ports.
+        try:
+            sock.bind((check_host, check_port))
+        except OSError:
+            return False
+        return True
 
     def pick_port(check_host: str, start_port: int, max_tries: int = 20) -> int:
-        if is_port_available(check_host, start_port):
-            return start_port
-        if port_was_explicit:
-            print(
-                f"[ERROR] Port {start_port} is already in use. "
-                f"Either stop the process using it or choose another port with LAUNCHER_PORT.\n"
-                f"        Example (PowerShell):  $env:LAUNCHER_PORT=8081; .\\01_start_launcher.bat\n"
-                f"        Example (cmd):        set LAUNCHER_PORT=8081 & 01_start_launcher.bat\n"
-                f"        Find PID:             netstat -ano | findstr :{start_port}\n"
-                f"        Kill PID:             taskkill /PID <pid> /F"
-            )
-            sys.exit(1)
-        for p in range(start_port + 1, start_port + 1 + max_tries):
-            if is_port_available(check_host, p):
-                print(f"[WARN] Port {start_port} is in use. Using {p} instead.")
-                return p
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if is_port_available(check_host, start_port, sock):
+                return start_port
+            if port_was_explicit:
+                print(
+                    f"[ERROR] Port {start_port} is already in use. "
+                    f"Either stop the process using it or choose another port with LAUNCHER_PORT.\n"
+                    f"        Example (PowerShell):  $env:LAUNCHER_PORT=8081; .\\01_start_launcher.bat\n"
+                    f"        Example (cmd):        set LAUNCHER_PORT=8081 & 01_start_launcher.bat\n"
+                    f"        Find PID:             netstat -ano | findstr :{start_port}\n"
+                    f"        Kill PID:             taskkill /PID <pid> /F"
+                )
+                sys.exit(1)
+            for p in range(start_port + 1, start_port + 1 + max_tries):
+                if is_port_available(check_host, p, sock):
+                    print(f"[WARN] Port {start_port} is in use. Using {p} instead.")
+                    return p
         print(f"[ERROR] No free port found in range {start_port}-{start_port + max_tries}.")
         sys.exit(1)
 
@@ -3,7 +3,7 @@ import asyncio                                           # 非同期処理関連
 import os                                                # 環境変数取得などOS依存機能を使用
 import socket                                            # ポート利用可否チェックに使用
 import sys                                               # 異常終了時の終了コード返却に使用
-from contextlib import closing                           # ソケットを安全に閉じるために使用
+from contextlib import asynccontextmanager, closing      # ソケットを安全に閉じる/lifespan定義に使用
 from fastapi import FastAPI, HTTPException, Request      # FastAPI本体とHTTP例外、リクエスト型
 from fastapi.responses import HTMLResponse, JSONResponse # HTML/JSONレスポンス型
 from fastapi.staticfiles import StaticFiles              # 静的ファイル配信
@@ -19,11 +19,19 @@ from app_manager import AppManager                       # アプリ起動/停
 
 
 # ============================== FastAPIアプリ本体の初期化 ==============================
+@asynccontextmanager                                      # 起動/停止時の処理をまとめるlifespan
+async def lifespan(app: FastAPI):                         # サーバーのライフサイクル管理
+    """Release shared resources held by the app manager on shutdown."""
+    yield                                                 # ここまでが起動処理、以降が停止処理
+    await app_manager.aclose()                            # HTTPセッションやログハンドルを閉じる
+
+
 # Initialize FastAPI app
 app = FastAPI(                                            # FastAPIアプリケーションインスタンスを生成
     title="Nexus Web Launcher",                           # OpenAPIタイトル
     description="Launch and manage local web applications", # OpenAPI説明
-    version="1.0.0"                                       # APIバージョン
+    version="1.0.0",                                      # APIバージョン
+    lifespan=lifespan                                     # 停止時にリソースを解放
 )
 
 # Setup paths
@@ -115,30 +123,8 @@ async def index(request: Request):                          # メイン画面描
 @app.get("/api/apps")                                      # アプリ一覧取得API
 async def get_apps():                                       # 全アプリと状態を返す
     """Get all applications and their states."""            # 関数説明
-    apps = config_manager.load_apps()                       # 設定ファイルから定義を読み込み
-
-    # Refresh states
-    await app_manager.refresh_states(apps)                  # 各アプリ状態を最新化
-
-    # Build response
-    result = []                                             # レスポンス配列初期化
-    for app in apps:                                        # 各アプリ定義を順に処理
-        state = app_manager.get_state(app.id)               # 既存状態を取得
-        if not state:                                       # 状態が未初期化なら
-            state = app_manager.init_state(app)             # 状態を初期化
-
-        result.append({                                     # API返却形式に整形
-            "id": app.id,                                  # ID
-            "name": app.name,                              # 名称
-            "workspace": app.workspace,                    # ワークスペース
-            "status": state.status.value,                  # 状態文字列
-            "message": state.message,                      # 補足メッセージ
-            "last_check": state.last_check,                # 最終確認時刻
-            "ports": app.ports,                            # 利用ポート
-            "open_urls": app_manager.resolve_open_urls(app) # 実際に開くURL
-        })
-
-    return {"apps": result}                                # JSONで返却
+    apps = await config_manager.aload_apps()                # 設定ファイルから定義を読み込み
+    return {"apps": await app_manager.refresh_and_get(apps)} # 状態更新とレスポンス整形をまとめて実行
 
 
 @app.post("/api/apps/launch")                              # アプリ起動API
@@ -231,7 +217,7 @@ async def update_workspace(request: UpdateWorkspaceRequest): # 更新処理
         raise HTTPException(status_code=404, detail="Application not found")  # 404返却
 
     # Update workspace
-    app.workspace = request.workspace                      # 定義オブジェクトのworkspaceを更新
+    app = app.model_copy(update={"workspace": request.workspace})  # キャッシュ共有の定義を直接変更せずコピーを更新
 
     success = config_manager.update_app(app)              # 設定ファイルへ反映
 
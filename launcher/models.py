@@ -1,6 +1,7 @@
 """Data models for launcher apps configuration."""
+from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from enum import Enum
 
 
@@ -48,6 +49,14 @@ class AppState(BaseModel):
     workspace: str
     status: AppStatus = AppStatus.STOPPED
     message: Optional[str] = None
-    last_check: Optional[str] = None
+    last_check_ts: Optional[float] = None
     ports: List[int] = Field(default_factory=list)
     open_urls: List[str] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def last_check(self) -> Optional[str]:
+        """Last check time as ISO 8601, formatted only when read."""
+        if self.last_check_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_check_ts).isoformat()
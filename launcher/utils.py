@@ -2,27 +2,47 @@
 import os
 import platform
 import re
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 
+# Directory containing the launcher sources; relative config/log paths resolve here
+LAUNCHER_DIR = Path(__file__).resolve().parent
+
+# Path patterns, compiled once
+_WIN_DRIVE_RE = re.compile(r'^[A-Za-z]:[/\\]')
+_WSL_LOCALHOST_RE = re.compile(r'^\\\\wsl\.localhost\\[^\\]+\\(.*)$', re.IGNORECASE)
+_WSL_DOLLAR_RE = re.compile(r'^\\\\wsl\$\\[^\\]+\\(.*)$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
 def detect_os() -> str:
     """Detect operating system.
     
+    The result is cached since it cannot change during the process lifetime.
+    
     Returns:
         'windows', 'wsl', or 'linux'
     """
-    system = platform.system().lower()
+    uname = platform.uname()
+    system = uname.system.lower()
     
     if system == 'windows':
         return 'windows'
     elif system == 'linux':
-        # Check if running in WSL
+        # Check if running in WSL; the kernel release names it, e.g.
+        # 5.15.0-microsoft-standard-WSL2 or 4.4.0-19041-Microsoft
+        release = uname.release.lower()
+        if 'microsoft' in release or 'wsl' in release:
+            return 'wsl'
+        # Fall back to /proc/version for kernels with a custom release string
         try:
             with open('/proc/version', 'r') as f:
                 if 'microsoft' in f.read().lower():
                     return 'wsl'
-        except:
+        except OSError:
             pass
         return 'linux'
     else:
@@ -39,7 +59,7 @@ def is_windows_path(path: str) -> bool:
         True if Windows path format
     """
     # Check for drive letter pattern
-    return bool(re.match(r'^[A-Za-z]:[/\\]', path))
+    return bool(_WIN_DRIVE_RE.match(path))
 
 
 def is_wsl_path(path: str) -> bool:
@@ -72,79 +92,81 @@ def normalize_path(path: str, target_os: str = None) -> str:
     
     if target_os == 'windows':
         # Convert to Windows path
-        if is_wsl_path(path):
-            # Convert /mnt/c/... to C:/...
-            match = re.match(r'^/mnt/([a-z])(/.*)?$', path)
-            if match:
-                drive = match.group(1).upper()
-                rest = match.group(2) or ''
-                path = f"{drive}:{rest}"
+        # Convert /mnt/c/... to C:/... (checked by character, no regex needed)
+        if (
+            path.startswith('/mnt/')
+            and len(path) >= 6
+            and 'a' <= path[5] <= 'z'
+            and (len(path) == 6 or path[6] == '/')
+        ):
+            path = f"{path[5].upper()}:{path[6:]}"
         # Ensure backslashes
-        path = path.replace('/', '\\')
+        if '/' in path:
+            path = path.replace('/', '\\')
     else:
         # Convert to WSL/Linux path
         if is_windows_path(path):
             # Convert C:/... to /mnt/c/...
-            match = re.match(r'^([A-Za-z]):(/.*)?$', path.replace('\\', '/'))
-            if match:
-                drive = match.group(1).lower()
-                rest = match.group(2) or ''
-                path = f"/mnt/{drive}{rest}"
+            path = f"/mnt/{path[0].lower()}{path[2:]}"
         # Ensure forward slashes
-        path = path.replace('\\', '/')
+        if '\\' in path:
+            path = path.replace('\\', '/')
     
     return path
 
 
-def get_shell_command(shell_type: str, command: str, cwd: str = None) -> Tuple[str, list]:
-    """Get shell executable and command arguments for subprocess.
+@lru_cache(maxsize=None)
+def _shell_invocation(shell_type: str) -> Tuple[str, Tuple[str, ...]]:
+    """Resolve the shell executable and leading arguments for the current OS.
     
     Args:
         shell_type: 'bash', 'powershell', or 'cmd'
-        command: Command string to execute
-        cwd: Working directory (optional, should be in WSL/Linux format if using bash on Windows)
         
     Returns:
-        Tuple of (executable, args_list)
+        Tuple of (executable, leading_args); the command string goes last
     """
     current_os = detect_os()
     
     if shell_type == 'bash':
         if current_os == 'windows':
             # Use WSL bash on Windows
-            executable = 'wsl'
-            # If cwd is provided, prepend cd command
-            if cwd:
-                command = f"cd '{cwd}' && {command}"
-            args = ['bash', '-lc', command]
-        else:
-            executable = 'bash'
-            args = ['-lc', command]
+            return 'wsl', ('bash', '-lc')
+        return 'bash', ('-lc',)
     
     elif shell_type == 'powershell':
         if current_os == 'windows':
-            executable = 'powershell.exe'
-            args = ['-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', command]
-        else:
-            # Try pwsh on Linux/WSL
-            executable = 'pwsh'
-            args = ['-NoProfile', '-Command', command]
+            return 'powershell.exe', ('-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command')
+        # Try pwsh on Linux/WSL
+        return 'pwsh', ('-NoProfile', '-Command')
     
     elif shell_type == 'cmd':
         if current_os == 'windows':
-            executable = 'cmd.exe'
-            args = ['/c', command]
-        else:
-            # Fallback to bash on Linux/WSL
-            executable = 'bash'
-            args = ['-c', command]
+            return 'cmd.exe', ('/c',)
+        # Fallback to bash on Linux/WSL
+        return 'bash', ('-c',)
     
-    else:
-        # Default to bash
-        executable = 'bash'
-        args = ['-lc', command]
+    # Default to bash
+    return 'bash', ('-lc',)
+
+
+def get_shell_command(shell_type: str, command: str, cwd: str = None) -> Tuple[str, list]:
+    """Get shell executable and command arguments for subprocess.
+    
+    Args:
+        shell_type: 'bash', 'powershell', or 'cmd'
+        command: Command string to execute
+        cwd: Working directory (optional, should be in WSL/Linux format if using bash on Windows)
+        
+    Returns:
+        Tuple of (executable, args_list)
+    """
+    executable, leading_args = _shell_invocation(shell_type)
     
-    return executable, args
+    if cwd and executable == 'wsl':
+        # WSL bash does not inherit the Windows cwd, so prepend a cd command
+        command = f"cd '{cwd}' && {command}"
+    
+    return executable, [*leading_args, command]
 
 
 def convert_wsl_network_path_to_linux(path: str) -> str:
@@ -163,13 +185,8 @@ def convert_wsl_network_path_to_linux(path: str) -> str:
         Converted path if WSL network path, otherwise original path
     """
     # Match \\wsl.localhost\<distro>\<path> or \\wsl$\<distro>\<path>
-    patterns = [
-        r'^\\\\wsl\.localhost\\[^\\]+\\(.*)$',
-        r'^\\\\wsl\$\\[^\\]+\\(.*)$'
-    ]
-    
-    for pattern in patterns:
-        match = re.match(pattern, path, re.IGNORECASE)
+    for pattern in (_WSL_LOCALHOST_RE, _WSL_DOLLAR_RE):
+        match = pattern.match(path)
         if match:
             linux_path = match.group(1)
             # Convert backslashes to forward slashes
@@ -182,15 +199,28 @@ def convert_wsl_network_path_to_linux(path: str) -> str:
     return path
 
 
+# Resolved workspace paths are reused within time buckets of this many seconds,
+# so a path created or removed on disk is picked up shortly afterwards.
+_RESOLVE_CACHE_TTL_SEC = 10.0
+
+
 def resolve_workspace_path(path: str) -> str:
     """Resolve workspace path and check if it exists.
     
+    Results are cached briefly to avoid repeated stat/resolve syscalls.
+    
     Args:
         path: Workspace path
         
     Returns:
         Resolved absolute path
     """
+    return _resolve_workspace_path_cached(path, int(time.monotonic() // _RESOLVE_CACHE_TTL_SEC))
+
+
+@lru_cache(maxsize=256)
+def _resolve_workspace_path_cached(path: str, time_bucket: int) -> str:
+    """Resolve a workspace path; `time_bucket` only scopes the cache entry."""
     path = os.path.expanduser(path)
     path = os.path.expandvars(path)
     